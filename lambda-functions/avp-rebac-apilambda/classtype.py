@@ -16,28 +16,30 @@
 
 from dataclasses import dataclass
 
-@dataclass
+# The Lambda runtime is Python 3.9, which doesn't support dataclass(slots=True), so __slots__ is declared explicitly
+
+@dataclass(frozen=True)
 class Directory:
+    __slots__ = ("directory_id", "directory_name", "owner_id", "owner_name", "parents_id", "isPublic")
     directory_id: str
     directory_name: str
-    directory_vertex: str
     owner_id: list
     owner_name: list
     parents_id: list
     isPublic: bool
 
-@dataclass    
+@dataclass(frozen=True)
 class Video:
+    __slots__ = ("video_id", "video_name", "owner_id", "owner_name", "parents_id", "isPublic")
     video_id: str
     video_name: str
-    video_vertex: str
     owner_id: list
     owner_name: list
     parents_id: list
     isPublic: bool
     
-@dataclass
+@dataclass(frozen=True)
 class User:
+    __slots__ = ("user_id", "user_name")
     user_id: str
-    user_name: str
-    user_vertex: str
\ No newline at end of file
+    user_name: str
\ No newline at end of file
@@ -15,56 +15,119 @@
 # SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 from __future__ import print_function
-import os, uuid
+import os, uuid, time, json
 from classtype import Directory, Video, User
-from gremlin_python import statics
-from gremlin_python.structure.graph import Graph
-from gremlin_python.process.graph_traversal import __
-from gremlin_python.process.strategies import *
-from gremlin_python.process.traversal import Cardinality
-from gremlin_python.driver.driver_remote_connection import DriverRemoteConnection
+from util import client
 
 neptune_endpoint = os.environ['NEPTUNE_ENDPOINT']
 neptune_port = os.environ['NEPTUNE_PORT']
 
-# Connecting to Amazon Neptune
-remote_connection = DriverRemoteConnection('wss://' + neptune_endpoint + ':' + neptune_port + '/gremlin', 'g')
-graph = Graph()
-g = graph.traversal().withRemote(remote_connection)
+# Queries are sent as openCypher over HTTPS through the Neptune Data API, one request per query
+NEPTUNE_DATA_ENDPOINT = 'https://' + neptune_endpoint + ':' + neptune_port
+
+class DatabaseError(Exception):
+    pass
+
+def run_query(query: str, **parameters):
+    neptunedata = client('neptunedata', endpoint_url=NEPTUNE_DATA_ENDPOINT)
+    # botocore is already loaded once the client exists. Transient failures are retried once by the client config before they surface here
+    from botocore.exceptions import BotoCoreError, ClientError
+    try:
+        response = neptunedata.execute_open_cypher_query(openCypherQuery=query, parameters=json.dumps(parameters))
+    except (BotoCoreError, ClientError) as e:
+        raise DatabaseError(f"Neptune query failed: {str(e)}") from e
+    return response['results']
 
 directory_id = str(uuid.uuid4())
 video_id = str(uuid.uuid4())
 
 def query_user_info(user_name: str):
-    user_id = g.V().hasLabel('user').has('name', user_name).values('userId').next()
-    user_vertex = g.V().hasLabel('user').has('userId', user_id).has('name', user_name).next()
-    return User(user_id, user_name, user_vertex)
-        
+    user_id = run_query("MATCH (u:user {name: $name}) RETURN u.userId AS userId", name=user_name)[0]['userId']
+    return User(user_id, user_name)
+
+# Looks up a directory or video by name
+INFO_QUERY = """
+MATCH (n:{label} {{name: $name}})
+RETURN n.{id_key} AS id, n.isPublic AS isPublic
+"""
+
+# Looks up a directory or video by name together with its owners and parents. The owners are the owners of the
+# resource and of petVideosDirectory, the parents are the directories it is a direct member of and petVideosDirectory.
+INFO_WITH_ANCESTORS_QUERY = """
+MATCH (n:{label} {{name: $name}})
+OPTIONAL MATCH (owner:user)-[:OWNER]->(n)
+OPTIONAL MATCH (n)-[:MEMBEROF]->(parent:directory)
+OPTIONAL MATCH (n)-[:MEMBEROF*]->(root:directory {{name: 'petVideosDirectory'}})
+OPTIONAL MATCH (rootOwner:user)-[:OWNER]->(root)
+RETURN n.{id_key} AS id, n.isPublic AS isPublic,
+       collect(DISTINCT owner.userId) + collect(DISTINCT rootOwner.userId) AS ownerIds,
+       collect(DISTINCT owner.name) + collect(DISTINCT rootOwner.name) AS ownerNames,
+       collect(DISTINCT parent.directoryId) + collect(DISTINCT root.directoryId) AS parentIds
+"""
+
+# The queries only differ in the label and id property, so they are formatted once at module load
+QUERIES = {
+    label: (INFO_QUERY.format(label=label, id_key=id_key), INFO_WITH_ANCESTORS_QUERY.format(label=label, id_key=id_key))
+    for label, id_key in (('directory', 'directoryId'), ('video', 'videoId'))
+}
+
+# Directory parentage rarely changes, so owners and parents are cached per name for up to this many seconds
+ANCESTORS_CACHE_TTL = 60
+ANCESTORS_CACHE_MAX_SIZE = 1024
+ancestors_cache = {}
+
+def unique(values: list) -> tuple:
+    return tuple(dict.fromkeys(values))
+
+def query_info(label: str, name: str):
+    info_query, info_with_ancestors_query = QUERIES[label]
+    now = time.time()
+    cached = ancestors_cache.get((label, name))
+    if cached and cached[0] > now:
+        result = run_query(info_query, name=name)
+        if not result:
+            return None
+        return (result[0]['id'], result[0]['isPublic']) + cached[1:]
+
+    result = run_query(info_with_ancestors_query, name=name)
+    if not result:
+        return None
+    info = result[0]
+    ancestors = (unique(info['ownerIds']), unique(info['ownerNames']), unique(info['parentIds']))
+    if len(ancestors_cache) >= ANCESTORS_CACHE_MAX_SIZE:
+        ancestors_cache.clear()
+    ancestors_cache[(label, name)] = (now + ANCESTORS_CACHE_TTL,) + ancestors
+    return (info['id'], info['isPublic']) + ancestors
+
+# Names of existing directories and videos are cached for up to this many seconds, so requests
+# for names that don't exist are rejected without a round-trip to Neptune
+KNOWN_NAMES_CACHE_TTL = 300
+known_names_cache = {}
+
+def name_exists(label: str, name: str) -> bool:
+    now = time.time()
+    cached = known_names_cache.get(label)
+    if not cached or cached[0] <= now:
+        cached = (now + KNOWN_NAMES_CACHE_TTL, query_names(label))
+        known_names_cache[label] = cached
+    return name in cached[1]
+
+def query_names(label: str):
+    return frozenset(row['name'] for row in run_query(f"MATCH (n:{label}) RETURN n.name AS name"))
+
 def query_directory_info(directory_name: str):
-    directoryExists = g.V().hasLabel('directory').has('name', directory_name).toList()
-    if not directoryExists:
+    info = query_info('directory', directory_name)
+    if info is None:
         return None
-    else:
-        directory_id = g.V().hasLabel('directory').has('name', directory_name).values('directoryId').next()
-        directory_vertex = g.V().hasLabel('directory').has('directoryId', directory_id).has('name', directory_name).next()
-        owner_id = g.V().hasLabel('directory').has('directoryId',directory_id).union(__.in_('OWNER'),__.repeat(__.out('MEMBEROF')).until(__.has('name', 'petVideosDirectory')).in_('OWNER')).dedup().values('userId').toList()
-        owner_name = g.V().hasLabel('directory').has('directoryId',directory_id).union(__.in_('OWNER'),__.repeat(__.out('MEMBEROF')).until(__.has('name', 'petVideosDirectory')).in_('OWNER')).dedup().values('name').toList()
-        parents_id = g.V().hasLabel('directory').has('directoryId',directory_id).union(__.out('MEMBEROF'),__.repeat(__.out('MEMBEROF')).until(__.has('name', 'petVideosDirectory'))).dedup().values('directoryId').toList()
-        isPublic = g.V().hasLabel('directory').has('directoryId', directory_id).has('name', directory_name).values('isPublic').next()
-        return Directory(directory_id, directory_name, directory_vertex, owner_id, owner_name, parents_id, isPublic)
+    directory_id, isPublic, owner_id, owner_name, parents_id = info
+    return Directory(directory_id, directory_name, list(owner_id), list(owner_name), list(parents_id), isPublic)
         
 def query_video_info(video_name: str):
-    videoExists = g.V().hasLabel('video').has('name', video_name).toList()
-    if not videoExists:
+    info = query_info('video', video_name)
+    if info is None:
         return None
-    else:
-        video_id = g.V().hasLabel('video').has('name', video_name).values('videoId').next()
-        video_vertex = g.V().hasLabel('video').has('videoId', video_id).has('name', video_name).next()
-        owner_id = g.V().hasLabel('video').has('videoId',video_id).union(__.in_('OWNER'),__.repeat(__.out('MEMBEROF')).until(__.has('name', 'petVideosDirectory')).in_('OWNER')).dedup().values('userId').toList()
-        owner_name = g.V().hasLabel('video').has('videoId',video_id).union(__.in_('OWNER'),__.repeat(__.out('MEMBEROF')).until(__.has('name', 'petVideosDirectory')).in_('OWNER')).dedup().values('name').toList()
-        parents_id = g.V().hasLabel('video').has('videoId',video_id).union(__.out('MEMBEROF'),__.repeat(__.out('MEMBEROF')).until(__.has('name', 'petVideosDirectory'))).dedup().values('directoryId').toList()
-        isPublic = g.V().hasLabel('video').has('videoId', video_id).has('name', video_name).values('isPublic').next()
-        return Video(video_id, video_name, video_vertex, owner_id, owner_name, parents_id, isPublic)
+    video_id, isPublic, owner_id, owner_name, parents_id = info
+    return Video(video_id, video_name, list(owner_id), list(owner_name), list(parents_id), isPublic)
         
 def get_directory(directory_name: str):
     directoryInfo = query_directory_info(directory_name)
@@ -14,11 +14,17 @@
 # OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
 # SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
-from jose import JWTError
 import json
+from dataclasses import asdict
 import jwt
 import os
 
+# orjson is shipped in the Lambda layer, fall back to the standard library if the layer doesn't provide it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 import database
 import permissions
 from util import debug_object
@@ -27,9 +33,9 @@ Response = object
 
 ACTIONS = {
     # Directory
-    ("/directory/get", "GET"): "ViewDirectory",
+    "GET /directory/get": "ViewDirectory",
     # Video
-    ("/video/get", "GET"): "ViewVideo",
+    "GET /video/get": "ViewVideo",
 }
 
 def handler(event, context) -> Response:
@@ -51,17 +57,17 @@ def handler(event, context) -> Response:
     # Get the information about the requested action
     resource = event["resource"]
     method = event["httpMethod"]
-    action = ACTIONS.get((resource, method), "Unknown")
-    if action == "Unknown":
+    action = ACTIONS.get(method + " " + resource)
+    if action is None:
         return format_response({"message": "Unknown API call"}, 404)
 
     # Get the information about the principal from the JWT token
-    access_token = event["headers"]["Authorization"].split(" ")[1]
     try:
+        access_token = event["headers"]["Authorization"].split(" ")[1]
         jwt_claims = jwt.decode(access_token, options={"verify_signature": False})
         user_pool_id = jwt_claims["iss"].split("/")[-1]
         principal = "{}|{}".format(user_pool_id, jwt_claims["sub"])
-    except JWTError as e:
+    except (jwt.exceptions.DecodeError, KeyError, IndexError) as e:
         debug_object(e)
         return format_response({"message": "Access denied -- token broken"}, 401)
 
@@ -78,46 +84,41 @@ def handler(event, context) -> Response:
         video_name = str(event["queryStringParameters"]["videoName"]) if "videoName" in event["queryStringParameters"] else None
         
     # Check if the directory and video exists
-    if directory_name:
-        if database.query_directory_info(directory_name) is None:
-            return format_response({"message": "Invalid input -- directory doesn't exist"}, 400)
-    elif video_name:
-        if database.query_video_info(video_name) is None:
-            return format_response({"message": "Invalid input -- video doesn't exist"}, 400)
+    video_dir = None
+    video = None
+    try:
+        if directory_name:
+            # Names missing from the cached name set are rejected without querying Neptune
+            video_dir = database.query_directory_info(directory_name) if database.name_exists("directory", directory_name) else None
+            if video_dir is None:
+                return format_response({"message": "Invalid input -- directory doesn't exist"}, 400)
+        elif video_name:
+            video = database.query_video_info(video_name) if database.name_exists("video", video_name) else None
+            if video is None:
+                return format_response({"message": "Invalid input -- video doesn't exist"}, 400)
+    except database.DatabaseError as e:
+        print(str(e))
+        return format_response({"message": "Service unavailable -- database query failed"}, 503)
 
     id_token = event.get("headers", {}).get("id-token")
     if not id_token:
         return format_response({"message": "Access denied -- no identity token provided"}, 401)
-    try:
-        if directory_name:
-            video_dir = database.query_directory_info(directory_name)
-        elif video_name:
-            video = database.query_video_info(video_name)
-    except JWTError as e:
-        debug_object(e)
-        return format_response({"message": "Access denied -- token broken"}, 401)
 
-    if action == "ViewDirectory":
-        try:
+    try:
+        if action == "ViewDirectory":
             response = permissions.permissions_check_token_directory(id_token, action, video_dir)
-            if response["decision"] == "ALLOW":
-                determining_policies = response["determining_policies"][0]["policyId"]
-                return format_response({"message": f"Access allowed -- determining policy id is {determining_policies}"})
-            else:
-                return format_response({"message": "Access denied -- permissions check failed"}, 401)
-        except Exception as e:
-            return format_response({"message": f"Access denied -- permissions check failed - {str(e)}"}, 401)
-    
-    elif action == "ViewVideo":
-        try:
+        elif action == "ViewVideo":
             response = permissions.permissions_check_token_video(id_token, action, video)
-            if response["decision"] == "ALLOW":
-                determining_policies = response["determining_policies"][0]["policyId"]
-                return format_response({"message": f"Access allowed -- determining policy id is {determining_policies}"})
-            else:
-                return format_response({"message": "Access denied -- permissions check failed"}, 401)
-        except Exception as e:
-            return format_response({"message": f"Access denied -- permissions check failed - {str(e)}"}, 401)
+        return authorization_response(response)
+    except Exception as e:
+        return format_response({"message": f"Access denied -- permissions check failed - {str(e)}"}, 401)
+
+def authorization_response(response: dict) -> Response:
+    if response["decision"] == "ALLOW":
+        determining_policies = response["determining_policies"][0]["policyId"]
+        return format_response({"message": f"Access allowed -- determining policy id is {determining_policies}"})
+    else:
+        return format_response({"message": "Access denied -- permissions check failed"}, 401)
     
 def get_directory(directory_name: int) -> Response:
     return format_response({"directory": database.get_directory(directory_name)})
@@ -132,7 +133,13 @@ def format_response(body: object, status_code=200) -> object:
             "Content-Type": "application/json",
             "Access-Control-Allow-Origin": "*",
         },
-        "body": json.dumps(body, default=lambda o: o.__dict__),
+        "body": to_json(body),
     }
     debug_object(result)
-    return result
\ No newline at end of file
+    return result
+
+def to_json(body: object) -> str:
+    # orjson serializes the dataclasses in classtype natively
+    if orjson:
+        return orjson.dumps(body).decode()
+    return json.dumps(body, default=asdict)
\ No newline at end of file
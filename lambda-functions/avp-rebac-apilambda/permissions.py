@@ -17,39 +17,85 @@
 import logging
 from typing import Optional, Union
 
+import hashlib
+import json
 import os
-import boto3
+import time
+import jwt
 import database
 from classtype import Directory, Video
-from util import debug_object
+from util import client, debug_object
 
 POLICY_STORE_ID = os.environ["POLICY_STORE_ID"]
-avp = boto3.client("verifiedpermissions")
 
 logger = logging.getLogger()
-logger.setLevel(logging.INFO)
+
+# Decisions are cached for up to this many seconds, and never past the expiry of the identity token
+DECISION_CACHE_TTL = 30
+DECISION_CACHE_MAX_SIZE = 4096
+decision_cache = {}
 
 def entity(entity_type: str, entity_id: Union[str, int]) -> set:
     return {"entityType": f"PetVideosApp::{entity_type}", "entityId": str(entity_id)}
 
 def entity_set(entity_type: str, entity_ids: list):
-    return [{"entityType": f"PetVideosApp::{entity_type}", "entityId": str(entity_id)} for entity_id in entity_ids]
+    entity_type = f"PetVideosApp::{entity_type}"
+    return [{"entityType": entity_type, "entityId": entity_id if type(entity_id) is str else str(entity_id)} for entity_id in entity_ids]
 
 def attributes(**kwargs):
     return {key: attribute_value(value) for key, value in kwargs.items()}
 
+def attribute_set(value: Union[set, list]):
+    return {"set": [attribute_value(v) for v in value]}
+
+# Attribute value converters looked up by exact type, subclasses fall back to an isinstance check
+ATTRIBUTE_VALUE_TYPES = {
+    str: lambda value: {"string": value},
+    bool: lambda value: {"boolean": value},
+    set: attribute_set,
+    list: attribute_set,
+    dict: lambda value: {"entityIdentifier": value},
+}
+
 def attribute_value(value: any):
-    if isinstance(value, str):
-        return {"string": value}
-    elif isinstance(value, bool):
-        return {"boolean": value}
-    elif isinstance(value, set) or isinstance(value, list):
-        return {"set": [attribute_value(v) for v in value]}
-    elif isinstance(value, dict):
-        return {"entityIdentifier": value}
-    else:
-        raise ValueError(f"Unknown attribute value type: {type(value)}")
+    convert = ATTRIBUTE_VALUE_TYPES.get(type(value))
+    if convert is None:
+        convert = next((c for t, c in ATTRIBUTE_VALUE_TYPES.items() if isinstance(value, t)), None)
+        if convert is None:
+            raise ValueError(f"Unknown attribute value type: {type(value)}")
+    return convert(value)
     
+def token_expiry(token: str) -> float:
+    try:
+        return jwt.decode(token, options={"verify_signature": False})["exp"]
+    except (jwt.exceptions.DecodeError, KeyError):
+        return 0
+
+def is_authorized_with_token(args: dict) -> dict:
+    # The request is fully determined by its arguments, so they are hashed into the cache key
+    key = hashlib.blake2b(json.dumps(args, sort_keys=True).encode()).digest()
+    now = time.time()
+    cached = decision_cache.get(key)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    resp = client("verifiedpermissions").is_authorized_with_token(**args)
+    print(f"Determining policies: {resp['determiningPolicies']}")
+    print(resp["decision"])
+    result = {
+            "decision": resp["decision"],
+            "determining_policies": resp["determiningPolicies"]
+        }
+
+    if len(decision_cache) >= DECISION_CACHE_MAX_SIZE:
+        for expired in [k for k, (expires, _) in decision_cache.items() if expires <= now]:
+            del decision_cache[expired]
+        if len(decision_cache) >= DECISION_CACHE_MAX_SIZE:
+            decision_cache.clear()
+    expires = min(now + DECISION_CACHE_TTL, token_expiry(args["identityToken"]))
+    decision_cache[key] = (expires, result)
+    return result
+
 def permissions_check_token_directory(token: str, action: str, video_dir: Optional[Directory]) -> bool:
     action_entity = {"actionType": "PetVideosApp::Action", "actionId": action}
     resource_entity = entity("Application", "PetVideosApp")
@@ -85,13 +131,7 @@ def permissions_check_token_directory(token: str, action: str, video_dir: Option
     args["resource"] = resource_entity
 
     debug_object(args)
-    resp = avp.is_authorized_with_token(**args)
-    print(f"Determining policies: {resp['determiningPolicies']}")
-    print(resp["decision"])
-    return {
-            "decision": resp["decision"],
-            "determining_policies": resp["determiningPolicies"]
-        }
+    return is_authorized_with_token(args)
 
 def permissions_check_token_video(token: str, action: str, video: Video) -> bool:
     action_entity = {"actionType": "PetVideosApp::Action", "actionId": action}
@@ -128,10 +168,4 @@ def permissions_check_token_video(token: str, action: str, video: Video) -> bool
     args["resource"] = resource_entity
 
     debug_object(args)
-    resp = avp.is_authorized_with_token(**args)
-    print(f"Determining policies: {resp['determiningPolicies']}")
-    print(resp["decision"])
-    return {
-            "decision": resp["decision"],
-            "determining_policies": resp["determiningPolicies"]
-        }
\ No newline at end of file
+    return is_authorized_with_token(args)
\ No newline at end of file
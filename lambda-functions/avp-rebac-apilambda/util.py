@@ -1,5 +1,34 @@
 import json
+import logging
+import os
+
+# The log level is read from LOG_LEVEL, unknown levels fall back to INFO
+logger = logging.getLogger()
+log_level = logging.getLevelName(os.environ.get("LOG_LEVEL", "INFO").upper())
+logger.setLevel(log_level if isinstance(log_level, int) else logging.INFO)
+
+clients = {}
+
+
+def client(service: str, **kwargs):
+    # boto3 is imported and the client created on first use, so requests rejected early don't pay for it.
+    # The client is then kept for the lifetime of the container, its HTTPS connections are reused by warm invocations.
+    if service not in clients:
+        import boto3
+        from botocore.config import Config
+        config = Config(
+            max_pool_connections=50,
+            tcp_keepalive=True,
+            retries={"max_attempts": 2, "mode": "adaptive"},
+            connect_timeout=1.0,
+            read_timeout=3.0,
+        )
+        clients[service] = boto3.client(service, config=config, **kwargs)
+    return clients[service]
 
 
 def debug_object(obj: object) -> None:
+    # Formatting large objects such as the event and context is skipped unless debug logging is enabled
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
     print(json.dumps(obj, indent=2, default=str).replace("\n", "\r"))
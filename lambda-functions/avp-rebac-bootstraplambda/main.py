@@ -15,6 +15,7 @@
 # SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 
 import os, logging, boto3, uuid
+from concurrent.futures import ThreadPoolExecutor
 from gremlin_python import statics
 from gremlin_python.structure.graph import Graph
 from gremlin_python.process.graph_traversal import __
@@ -37,74 +38,75 @@ neptune_endpoint = os.environ['NEPTUNE_ENDPOINT']
 neptune_port = os.environ['NEPTUNE_PORT']
 policy_store_id = os.environ['POLICY_STORE_ID']
 
+# Clients are created once per container and reused by warm invocations
+verifiedpermissions = boto3.client('verifiedpermissions')
+cognito_idp = boto3.client('cognito-idp')
+
 def handler(event, context):
-    verifiedpermissions = boto3.client('verifiedpermissions')
     try:
-        # Creating Cognito users "Alice", "Bob" and "Charlie"
-        alice_id = create_cognito_user('alice', user_pool_id)
-        bob_id = create_cognito_user('bob', user_pool_id)
-        charlie_id = create_cognito_user('charlie', user_pool_id)
+        # Creating Cognito users "Alice", "Bob" and "Charlie", each user is created concurrently
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            alice_id, bob_id, charlie_id = executor.map(lambda username: create_cognito_user(username, user_pool_id), ['alice', 'bob', 'charlie'])
 
-        # Connecting to Amazon Neptune
+        # Connecting to Amazon Neptune, the connection is closed once the graph is written
         remote_connection = DriverRemoteConnection('wss://' + neptune_endpoint + ':' + neptune_port + '/gremlin', 'g')
-        graph = Graph()
-        g = graph.traversal().withRemote(remote_connection)
-        g.V().drop().iterate()
+        try:
+            graph = Graph()
+            g = graph.traversal().withRemote(remote_connection)
+            g.V().drop().iterate()
         
-        # Adding user vertices
-        alice_vertex = g.addV('user').property('name', 'alice').property('userId', alice_id).next()
-        bob_vertex = g.addV('user').property('name', 'bob').property('userId', bob_id).next()
-        charlie_vertex = g.addV('user').property('name', 'charlie').property('userId', charlie_id).next()
-
-        # Adding directory vertices
-        aliceVideosDir_vertex = g.addV('directory').property('name', 'aliceVideosDirectory').property('directoryId', aliceVideosDir_id).property('ownerId', alice_id).property('ownerName', 'alice').property('isPublic', False).next()
-        bobVideosDir_vertex = g.addV('directory').property('name', 'bobVideosDirectory').property('directoryId', bobVideosDir_id).property('ownerId', bob_id).property('ownerName', 'bob').property('isPublic', False).next()
-        petVideosDir_vertex = g.addV('directory').property('name', 'petVideosDirectory').property('directoryId', petVideosDir_id).property('ownerId', charlie_id).property('ownerName', 'charlie').property('isPublic', False).next()
-
-        # Adding video vertices
-        aliceCatVideo_vertex = g.addV('video').property('name', 'aliceCatVideo.mp4').property('videoId', aliceCatVideo_id).property('ownerId', alice_id).property('ownerName', 'alice').property('isPublic', False).next()
-        bobDogVideo_vertex = g.addV('video').property('name', 'bobDogVideo.mp4').property('videoId', bobDogVideo_id).property('ownerId', bob_id).property('ownerName', 'bob').property('isPublic', False).next()
-            
-        # Adding edges
-        g.V(charlie_vertex).addE('OWNER').to(petVideosDir_vertex).iterate()
-        g.V(aliceVideosDir_vertex).addE('MEMBEROF').to(petVideosDir_vertex).iterate()
-        g.V(bobVideosDir_vertex).addE('MEMBEROF').to(petVideosDir_vertex).iterate()
-        g.V(alice_vertex).addE('OWNER').to(aliceVideosDir_vertex).iterate()
-        g.V(aliceCatVideo_vertex).addE('MEMBEROF').to(aliceVideosDir_vertex).iterate()
-        g.V(bob_vertex).addE('OWNER').to(bobVideosDir_vertex).iterate()        
-        g.V(bobDogVideo_vertex).addE('MEMBEROF').to(bobVideosDir_vertex).iterate()
-        g.V(alice_vertex).addE('OWNER').to(aliceCatVideo_vertex).iterate()
-        g.V(bob_vertex).addE('OWNER').to(bobDogVideo_vertex).iterate()
-
-        # Close the connection
-        remote_connection.close()
+            # Adding vertices and edges in a single traversal, step labels let the edges reference the new vertices
+            (
+                # User vertices
+                g.addV('user').property('name', 'alice').property('userId', alice_id).as_('alice')
+                .addV('user').property('name', 'bob').property('userId', bob_id).as_('bob')
+                .addV('user').property('name', 'charlie').property('userId', charlie_id).as_('charlie')
+                # Directory vertices
+                .addV('directory').property('name', 'aliceVideosDirectory').property('directoryId', aliceVideosDir_id).property('ownerId', alice_id).property('ownerName', 'alice').property('isPublic', False).as_('aliceVideosDir')
+                .addV('directory').property('name', 'bobVideosDirectory').property('directoryId', bobVideosDir_id).property('ownerId', bob_id).property('ownerName', 'bob').property('isPublic', False).as_('bobVideosDir')
+                .addV('directory').property('name', 'petVideosDirectory').property('directoryId', petVideosDir_id).property('ownerId', charlie_id).property('ownerName', 'charlie').property('isPublic', False).as_('petVideosDir')
+                # Video vertices
+                .addV('video').property('name', 'aliceCatVideo.mp4').property('videoId', aliceCatVideo_id).property('ownerId', alice_id).property('ownerName', 'alice').property('isPublic', False).as_('aliceCatVideo')
+                .addV('video').property('name', 'bobDogVideo.mp4').property('videoId', bobDogVideo_id).property('ownerId', bob_id).property('ownerName', 'bob').property('isPublic', False).as_('bobDogVideo')
+                # Edges
+                .addE('OWNER').from_('charlie').to('petVideosDir')
+                .addE('MEMBEROF').from_('aliceVideosDir').to('petVideosDir')
+                .addE('MEMBEROF').from_('bobVideosDir').to('petVideosDir')
+                .addE('OWNER').from_('alice').to('aliceVideosDir')
+                .addE('MEMBEROF').from_('aliceCatVideo').to('aliceVideosDir')
+                .addE('OWNER').from_('bob').to('bobVideosDir')
+                .addE('MEMBEROF').from_('bobDogVideo').to('bobVideosDir')
+                .addE('OWNER').from_('alice').to('aliceCatVideo')
+                .addE('OWNER').from_('bob').to('bobDogVideo')
+                .iterate()
+            )
+        finally:
+            # Close the connection
+            remote_connection.close()
 
-        # Create Cedar policies in Verified Permissions policy store
-        response = verifiedpermissions.create_policy(
-            policyStoreId = policy_store_id,
-            definition = {
+        # Create Cedar policies in Verified Permissions policy store, the requests are independent so they are sent concurrently
+        policy_definitions = [
+            {
                 'static': {
                     'description': 'Resource owner and related persons can access the resources',
                     'statement': f"permit( principal, action in [PetVideosApp::Action::\"OwnerActions\"], resource in PetVideosApp::Directory::\"{petVideosDir_id}\") when {{ resource has owner && principal in resource.owner }};"
                 }
-            }
-        )
-        response = verifiedpermissions.create_policy(
-            policyStoreId = policy_store_id,
-            definition = {
+            },
+            {
                 'static': {
                     'description': 'Allow public access to the resources',
                     'statement': f"permit( principal, action in [PetVideosApp::Action::\"PublicActions\"], resource in PetVideosApp::Directory::\"{petVideosDir_id}\") when {{ resource has isPublic && resource.isPublic == true }};"
                 }
-            }
-        )
+            },
+        ]
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda definition: verifiedpermissions.create_policy(policyStoreId = policy_store_id, definition = definition), policy_definitions))
         print("The solution is successfully bootstrapped.")
     except Exception as e:
         logger.error(f"An error occurred while bootstrapping the solution: {str(e)}")
         raise
     
 def create_cognito_user(username, user_pool_id):
-    cognito_idp = boto3.client('cognito-idp')
     try:
         response = cognito_idp.admin_create_user(
             UserPoolId=user_pool_id,
@@ -117,6 +119,7 @@ def create_cognito_user(username, user_pool_id):
         avp_username_id = f"{user_pool_id}|{sub}"
     except Exception as e:
         print(f"Error creating user {username}: {str(e)}")
+        raise
 
     try:
         response = cognito_idp.admin_set_user_password(
@@ -127,4 +130,5 @@ def create_cognito_user(username, user_pool_id):
         )
     except Exception as e:
         print(f"Error setting permanent password for user {username}: {str(e)}")
+        raise
     return avp_username_id
\ No newline at end of file
@@ -19,6 +19,18 @@ from crhelper import CfnResource
 
 helper = CfnResource()
 
+cognito_client = None
+lambda_client = None
+
+def get_clients():
+    # Clients are created on first use, so the no-op update and delete events don't pay for them.
+    # They are then kept for the lifetime of the container and reused by warm invocations.
+    global cognito_client, lambda_client
+    if cognito_client is None:
+        cognito_client = boto3.client("cognito-idp")
+        lambda_client = boto3.client("lambda")
+    return cognito_client, lambda_client
+
 @helper.create
 def create(event, _):
     client_id = event["ResourceProperties"]["ClientID"]
@@ -28,8 +40,7 @@ def create(event, _):
     cup_client_id = event["ResourceProperties"]["CUP_CLIENT_ID"]
     cup_client_secret = event["ResourceProperties"]["CUP_CLIENT_SECRET"]
     cup_domain = event["ResourceProperties"]["CUP_DOMAIN"]
-    cognito_client = boto3.client("cognito-idp")
-    lambda_client = boto3.client("lambda")
+    cognito_client, lambda_client = get_clients()
     
     # Update user pool client
     params = {